@@ -133,7 +133,7 @@ async def download_model(request: ModelRequest):
         
         # Check current status
         status = await ollama_service.check_ollama_status()
-        logger.debug(f"Current Ollama status: installed={status['installed']}, running={status['running']}")
+        logger.debug("Current Ollama status: installed=%s, running=%s", status["installed"], status["running"])
         
         if not status["installed"]:
             raise HTTPException(status_code=400, detail="Ollama is not installed on this system")
@@ -169,7 +169,7 @@ async def download_model_with_progress(request: ModelRequest):
         
         # Check current status
         status = await ollama_service.check_ollama_status()
-        logger.debug(f"Current Ollama status: installed={status['installed']}, running={status['running']}")
+        logger.debug("Current Ollama status: installed=%s, running=%s", status["installed"], status["running"])
         
         if not status["installed"]:
             raise HTTPException(status_code=400, detail="Ollama is not installed on this system")
@@ -254,7 +254,7 @@ async def delete_model(model_name: str):
         
         # Check current status
         status = await ollama_service.check_ollama_status()
-        logger.debug(f"Current Ollama status: installed={status['installed']}, running={status['running']}")
+        logger.debug("Current Ollama status: installed=%s, running=%s", status["installed"], status["running"])
         
         if not status["installed"]:
             raise HTTPException(status_code=400, detail="Ollama is not installed on this system")
@@ -63,10 +63,10 @@ class OllamaService:
             try:
                 response = requests.get(endpoint, timeout=3)
                 if response.status_code == 200:
-                    logger.debug(f"Ollama server confirmed running via {endpoint}")
+                    logger.debug("Ollama server confirmed running via %s", endpoint)
                     return True
             except requests.RequestException as e:
-                logger.debug(f"Failed to connect to {endpoint}: {e}")
+                logger.debug("Failed to connect to %s: %s", endpoint, e)
                 continue
         
         logger.debug("Ollama server not reachable on any endpoint")
@@ -84,7 +84,7 @@ class OllamaService:
                 return [model["name"] for model in data["models"]] if "models" in data else []
             return []
         except requests.RequestException as e:
-            logger.debug(f"Failed to get models: {e}")
+            logger.debug("Failed to get models: %s", e)
             return []
     
     def _start_ollama_server(self) -> bool:
@@ -109,7 +109,7 @@ class OllamaService:
                 if self._is_ollama_server_running():
                     logger.info(f"Ollama server started successfully after {i+1} seconds")
                     return True
-                logger.debug(f"Waiting for Ollama server... ({i+1}/20)")
+                logger.debug("Waiting for Ollama server... (%d/20)", i + 1)
             
             logger.error("Ollama server failed to start within 20 seconds")
             return False
@@ -485,7 +485,7 @@ class OllamaService:
             self._status_cache = status
             self._last_check = current_time
             
-            logger.debug(f"Ollama status: installed={is_installed}, running={is_running}, models={len(models)}")
+            logger.debug("Ollama status: installed=%s, running=%s, models=%d", is_installed, is_running, len(models))
             return status
             
         except Exception as e:
@@ -3,7 +3,7 @@ from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
 import json
 
-from src.tools.api import get_financial_metrics
+from src.tools.api import get_financial_metrics_batch
 
 
 ##### Fundamental Agent #####
@@ -16,16 +16,13 @@ def fundamentals_analyst_agent(state: AgentState):
     # Initialize fundamental analysis for each ticker
     fundamental_analysis = {}
 
+    # Fetch metrics for all tickers up front; uncached tickers are fetched
+    # concurrently instead of one network round-trip per loop iteration.
+    progress.update_status("fundamentals_analyst_agent", None, "Fetching financial metrics")
+    metrics_by_ticker = get_financial_metrics_batch(tickers, end_date=end_date, period="ttm", limit=10)
+
     for ticker in tickers:
-        progress.update_status("fundamentals_analyst_agent", ticker, "Fetching financial metrics")
-
-        # Get the financial metrics
-        financial_metrics = get_financial_metrics(
-            ticker=ticker,
-            end_date=end_date,
-            period="ttm",
-            limit=10,
-        )
+        financial_metrics = metrics_by_ticker.get(ticker, [])
 
         if not financial_metrics:
             progress.update_status("fundamentals_analyst_agent", ticker, "Failed: No financial metrics found")
@@ -1,7 +1,9 @@
+import numpy as np
+
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
-from src.tools.api import get_prices, prices_to_df
+from src.tools.api import get_prices_batch
 import json
 
 
@@ -16,43 +18,42 @@ def risk_management_agent(state: AgentState):
     risk_analysis = {}
     current_prices = {}  # Store prices here to avoid redundant API calls
 
-    # First, fetch prices for all relevant tickers
+    # First, fetch prices for all relevant tickers in a single batch call.
+    # The batch helper dispatches uncached fetches concurrently, so this costs
+    # roughly one network round-trip instead of one per ticker.
     all_tickers = set(tickers) | set(portfolio.get("positions", {}).keys())
-    
-    for ticker in all_tickers:
-        progress.update_status("risk_management_agent", ticker, "Fetching price data")
-        
-        prices = get_prices(
-            ticker=ticker,
-            start_date=data["start_date"],
-            end_date=data["end_date"],
-        )
 
+    progress.update_status("risk_management_agent", None, "Fetching price data")
+    prices_by_ticker = get_prices_batch(list(all_tickers), start_date=data["start_date"], end_date=data["end_date"])
+
+    for ticker, prices in prices_by_ticker.items():
         if not prices:
             progress.update_status("risk_management_agent", ticker, "Warning: No price data found")
             continue
 
-        prices_df = prices_to_df(prices)
-        
-        if not prices_df.empty:
-            current_price = prices_df["close"].iloc[-1]
-            current_prices[ticker] = current_price
-            progress.update_status("risk_management_agent", ticker, f"Current price: {current_price}")
-        else:
-            progress.update_status("risk_management_agent", ticker, "Warning: Empty price data")
+        # Only the latest close matters here, so pull it straight from the
+        # price list (ISO timestamps sort lexicographically) instead of
+        # building a full DataFrame per ticker just to read one cell
+        current_price = max(prices, key=lambda p: p.time).close
+        current_prices[ticker] = current_price
+        progress.update_status("risk_management_agent", ticker, f"Current price: {current_price}")
 
     # Calculate total portfolio value based on current market prices (Net Liquidation Value)
-    total_portfolio_value = portfolio.get("cash", 0.0)
-    
-    for ticker, position in portfolio.get("positions", {}).items():
-        if ticker in current_prices:
-            # Add market value of long positions
-            total_portfolio_value += position.get("long", 0) * current_prices[ticker]
-            # Subtract market value of short positions
-            total_portfolio_value -= position.get("short", 0) * current_prices[ticker]
-    
+    # Computed once here and reused for every ticker's position limit below.
+    # Net shares (long - short) and prices go into numpy arrays so the
+    # exposure sum is a single dot product rather than a Python-level loop.
+    positions = portfolio.get("positions", {})
+    held_tickers = [ticker for ticker in positions if ticker in current_prices]
+    net_shares = np.fromiter((positions[ticker].get("long", 0) - positions[ticker].get("short", 0) for ticker in held_tickers), dtype=np.float64, count=len(held_tickers))
+    held_prices = np.fromiter((current_prices[ticker] for ticker in held_tickers), dtype=np.float64, count=len(held_tickers))
+    total_portfolio_value = float(portfolio.get("cash", 0.0) + net_shares @ held_prices)
+
+
     progress.update_status("risk_management_agent", None, f"Total portfolio value: {total_portfolio_value}")
 
+    # Hoist loop-invariant lookups out of the per-ticker loop
+    available_cash = portfolio.get("cash", 0)
+
     # Calculate risk limits for each ticker in the universe
     for ticker in tickers:
         progress.update_status("risk_management_agent", ticker, "Calculating position limits")
@@ -71,7 +72,7 @@ def risk_management_agent(state: AgentState):
         current_price = current_prices[ticker]
         
         # Calculate current market value of this position
-        position = portfolio.get("positions", {}).get(ticker, {})
+        position = positions.get(ticker, {})
         long_value = position.get("long", 0) * current_price
         short_value = position.get("short", 0) * current_price
         current_position_value = abs(long_value - short_value)  # Use absolute exposure
@@ -83,7 +84,7 @@ def risk_management_agent(state: AgentState):
         remaining_position_limit = position_limit - current_position_value
         
         # Ensure we don't exceed available cash
-        max_position_size = min(remaining_position_limit, portfolio.get("cash", 0))
+        max_position_size = min(remaining_position_limit, available_cash)
         
         risk_analysis[ticker] = {
             "remaining_position_limit": float(max_position_size),
@@ -93,7 +94,7 @@ def risk_management_agent(state: AgentState):
                 "current_position_value": float(current_position_value),
                 "position_limit": float(position_limit),
                 "remaining_limit": float(remaining_position_limit),
-                "available_cash": float(portfolio.get("cash", 0)),
+                "available_cash": float(available_cash),
             },
         }
         
@@ -5,7 +5,7 @@ import pandas as pd
 import numpy as np
 import json
 
-from src.tools.api import get_insider_trades, get_company_news
+from src.tools.api import get_insider_trades_batch, get_company_news_batch
 
 
 ##### Sentiment Agent #####
@@ -18,45 +18,48 @@ def sentiment_analyst_agent(state: AgentState):
     # Initialize sentiment analysis for each ticker
     sentiment_analysis = {}
 
-    for ticker in tickers:
-        progress.update_status("sentiment_analyst_agent", ticker, "Fetching insider trades")
-
-        # Get the insider trades
-        insider_trades = get_insider_trades(
-            ticker=ticker,
-            end_date=end_date,
-            limit=1000,
-        )
+    # Fetch insider trades and news for all tickers up front; uncached
+    # tickers are fetched concurrently instead of serially per loop iteration.
+    progress.update_status("sentiment_analyst_agent", None, "Fetching insider trades")
+    insider_trades_by_ticker = get_insider_trades_batch(tickers, end_date=end_date, limit=1000)
+    progress.update_status("sentiment_analyst_agent", None, "Fetching company news")
+    company_news_by_ticker = get_company_news_batch(tickers, end_date=end_date, limit=100)
 
+    for ticker in tickers:
         progress.update_status("sentiment_analyst_agent", ticker, "Analyzing trading patterns")
 
-        # Get the signals from the insider trades
+        # Get the signals from the insider trades. Each signal class is
+        # counted once with a vectorized mask instead of repeated list.count
+        # scans over the materialized signal lists.
+        insider_trades = insider_trades_by_ticker.get(ticker, [])
         transaction_shares = pd.Series([t.transaction_shares for t in insider_trades]).dropna()
-        insider_signals = np.where(transaction_shares < 0, "bearish", "bullish").tolist()
-
-        progress.update_status("sentiment_analyst_agent", ticker, "Fetching company news")
+        insider_total = len(transaction_shares)
+        insider_bearish = int(np.count_nonzero(transaction_shares < 0))
+        insider_bullish = insider_total - insider_bearish
 
         # Get the company news
-        company_news = get_company_news(ticker, end_date, limit=100)
+        company_news = company_news_by_ticker.get(ticker, [])
 
         # Get the sentiment from the company news
         sentiment = pd.Series([n.sentiment for n in company_news]).dropna()
-        news_signals = np.where(sentiment == "negative", "bearish", 
-                              np.where(sentiment == "positive", "bullish", "neutral")).tolist()
-        
+        news_total = len(sentiment)
+        news_bearish = int(np.count_nonzero(sentiment == "negative"))
+        news_bullish = int(np.count_nonzero(sentiment == "positive"))
+        news_neutral = news_total - news_bearish - news_bullish
+
         progress.update_status("sentiment_analyst_agent", ticker, "Combining signals")
         # Combine signals from both sources with weights
         insider_weight = 0.3
         news_weight = 0.7
-        
+
         # Calculate weighted signal counts
         bullish_signals = (
-            insider_signals.count("bullish") * insider_weight +
-            news_signals.count("bullish") * news_weight
+            insider_bullish * insider_weight +
+            news_bullish * news_weight
         )
         bearish_signals = (
-            insider_signals.count("bearish") * insider_weight +
-            news_signals.count("bearish") * news_weight
+            insider_bearish * insider_weight +
+            news_bearish * news_weight
         )
 
         if bullish_signals > bearish_signals:
@@ -67,38 +70,38 @@ def sentiment_analyst_agent(state: AgentState):
             overall_signal = "neutral"
 
         # Calculate confidence level based on the weighted proportion
-        total_weighted_signals = len(insider_signals) * insider_weight + len(news_signals) * news_weight
+        total_weighted_signals = insider_total * insider_weight + news_total * news_weight
         confidence = 0  # Default confidence when there are no signals
         if total_weighted_signals > 0:
             confidence = round((max(bullish_signals, bearish_signals) / total_weighted_signals) * 100, 2)
-        
+
         # Create structured reasoning similar to technical analysis
         reasoning = {
             "insider_trading": {
-                "signal": "bullish" if insider_signals.count("bullish") > insider_signals.count("bearish") else 
-                         "bearish" if insider_signals.count("bearish") > insider_signals.count("bullish") else "neutral",
-                "confidence": round((max(insider_signals.count("bullish"), insider_signals.count("bearish")) / max(len(insider_signals), 1)) * 100),
+                "signal": "bullish" if insider_bullish > insider_bearish else
+                         "bearish" if insider_bearish > insider_bullish else "neutral",
+                "confidence": round((max(insider_bullish, insider_bearish) / max(insider_total, 1)) * 100),
                 "metrics": {
-                    "total_trades": len(insider_signals),
-                    "bullish_trades": insider_signals.count("bullish"),
-                    "bearish_trades": insider_signals.count("bearish"),
+                    "total_trades": insider_total,
+                    "bullish_trades": insider_bullish,
+                    "bearish_trades": insider_bearish,
                     "weight": insider_weight,
-                    "weighted_bullish": round(insider_signals.count("bullish") * insider_weight, 1),
-                    "weighted_bearish": round(insider_signals.count("bearish") * insider_weight, 1),
+                    "weighted_bullish": round(insider_bullish * insider_weight, 1),
+                    "weighted_bearish": round(insider_bearish * insider_weight, 1),
                 }
             },
             "news_sentiment": {
-                "signal": "bullish" if news_signals.count("bullish") > news_signals.count("bearish") else 
-                         "bearish" if news_signals.count("bearish") > news_signals.count("bullish") else "neutral",
-                "confidence": round((max(news_signals.count("bullish"), news_signals.count("bearish")) / max(len(news_signals), 1)) * 100),
+                "signal": "bullish" if news_bullish > news_bearish else
+                         "bearish" if news_bearish > news_bullish else "neutral",
+                "confidence": round((max(news_bullish, news_bearish) / max(news_total, 1)) * 100),
                 "metrics": {
-                    "total_articles": len(news_signals),
-                    "bullish_articles": news_signals.count("bullish"),
-                    "bearish_articles": news_signals.count("bearish"),
-                    "neutral_articles": news_signals.count("neutral"),
+                    "total_articles": news_total,
+                    "bullish_articles": news_bullish,
+                    "bearish_articles": news_bearish,
+                    "neutral_articles": news_neutral,
                     "weight": news_weight,
-                    "weighted_bullish": round(news_signals.count("bullish") * news_weight, 1),
-                    "weighted_bearish": round(news_signals.count("bearish") * news_weight, 1),
+                    "weighted_bullish": round(news_bullish * news_weight, 1),
+                    "weighted_bearish": round(news_bearish * news_weight, 1),
                 }
             },
             "combined_analysis": {
@@ -161,6 +161,15 @@ def stanley_druckenmiller_agent(state: AgentState):
     return {"messages": [message], "data": state["data"]}
 
 
+def _prices_sorted_by_time(prices: list) -> list:
+    """Return prices oldest-first. get_prices already delivers them in order,
+    so the common case is a linear check instead of an attribute-key sort."""
+    times = [p.time for p in prices]
+    if all(a <= b for a, b in zip(times, times[1:])):
+        return prices
+    return sorted(prices, key=lambda p: p.time)
+
+
 def analyze_growth_and_momentum(financial_line_items: list, prices: list) -> dict:
     """
     Evaluate:
@@ -230,7 +239,7 @@ def analyze_growth_and_momentum(financial_line_items: list, prices: list) -> dic
     #
     # We'll give up to 3 points for strong momentum
     if prices and len(prices) > 30:
-        sorted_prices = sorted(prices, key=lambda p: p.time)
+        sorted_prices = _prices_sorted_by_time(prices)
         close_prices = [p.close for p in sorted_prices if p.close is not None]
         if len(close_prices) >= 2:
             start_price = close_prices[0]
@@ -383,7 +392,7 @@ def analyze_risk_reward(financial_line_items: list, prices: list) -> dict:
     # 2. Price Volatility
     #
     if len(prices) > 10:
-        sorted_prices = sorted(prices, key=lambda p: p.time)
+        sorted_prices = _prices_sorted_by_time(prices)
         close_prices = [p.close for p in sorted_prices if p.close is not None]
         if len(close_prices) > 10:
             daily_returns = []
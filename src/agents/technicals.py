@@ -8,7 +8,7 @@ import json
 import pandas as pd
 import numpy as np
 
-from src.tools.api import get_prices, prices_to_df
+from src.tools.api import get_price_data, get_prices_batch
 from src.utils.progress import progress
 
 
@@ -49,22 +49,32 @@ def technical_analyst_agent(state: AgentState):
     # Initialize analysis for each ticker
     technical_analysis = {}
 
+    # Warm the price cache for all tickers up front; the batch helper fans
+    # uncached fetches out over a thread pool, so the loop below reads from
+    # memory. The indicator math itself stays serial - it is CPU-bound pandas
+    # work that would only serialize on the GIL in threads.
+    progress.update_status("technical_analyst_agent", None, "Fetching price data")
+    get_prices_batch(tickers, start_date=start_date, end_date=end_date)
+
     for ticker in tickers:
         progress.update_status("technical_analyst_agent", ticker, "Analyzing price data")
 
-        # Get the historical price data
-        prices = get_prices(
+        # Get the historical price data as a DataFrame. get_price_data memoizes
+        # the columnar conversion, so the expensive dict-to-DataFrame step runs
+        # once per (ticker, window) across all agents rather than per call.
+        prices_df = get_price_data(
             ticker=ticker,
             start_date=start_date,
             end_date=end_date,
         )
 
-        if not prices:
+        if prices_df.empty:
             progress.update_status("technical_analyst_agent", ticker, "Failed: No price data found")
             continue
 
-        # Convert prices to a DataFrame
-        prices_df = prices_to_df(prices)
+        # Daily returns feed momentum, volatility, and stat-arb signals;
+        # compute the series once instead of once per strategy.
+        returns = prices_df["close"].pct_change()
 
         progress.update_status("technical_analyst_agent", ticker, "Calculating trend signals")
         trend_signals = calculate_trend_signals(prices_df)
@@ -73,13 +83,13 @@ def technical_analyst_agent(state: AgentState):
         mean_reversion_signals = calculate_mean_reversion_signals(prices_df)
 
         progress.update_status("technical_analyst_agent", ticker, "Calculating momentum")
-        momentum_signals = calculate_momentum_signals(prices_df)
+        momentum_signals = calculate_momentum_signals(prices_df, returns)
 
         progress.update_status("technical_analyst_agent", ticker, "Analyzing volatility")
-        volatility_signals = calculate_volatility_signals(prices_df)
+        volatility_signals = calculate_volatility_signals(prices_df, returns)
 
         progress.update_status("technical_analyst_agent", ticker, "Statistical analysis")
-        stat_arb_signals = calculate_stat_arb_signals(prices_df)
+        stat_arb_signals = calculate_stat_arb_signals(prices_df, returns)
 
         # Combine all signals using a weighted ensemble approach
         strategy_weights = {
@@ -168,17 +178,19 @@ def calculate_trend_signals(prices_df):
     # Calculate ADX for trend strength
     adx = calculate_adx(prices_df, 14)
 
-    # Determine trend direction and strength
-    short_trend = ema_8 > ema_21
-    medium_trend = ema_21 > ema_55
+    # Determine trend direction and strength from the latest values; comparing
+    # scalars avoids materializing two aligned full-length boolean Series just
+    # to read their last elements
+    short_trend = ema_8.iloc[-1] > ema_21.iloc[-1]
+    medium_trend = ema_21.iloc[-1] > ema_55.iloc[-1]
 
     # Combine signals with confidence weighting
     trend_strength = adx["adx"].iloc[-1] / 100.0
 
-    if short_trend.iloc[-1] and medium_trend.iloc[-1]:
+    if short_trend and medium_trend:
         signal = "bullish"
         confidence = trend_strength
-    elif not short_trend.iloc[-1] and not medium_trend.iloc[-1]:
+    elif not short_trend and not medium_trend:
         signal = "bearish"
         confidence = trend_strength
     else:
@@ -237,12 +249,13 @@ def calculate_mean_reversion_signals(prices_df):
     }
 
 
-def calculate_momentum_signals(prices_df):
+def calculate_momentum_signals(prices_df, returns=None):
     """
     Multi-factor momentum strategy
     """
     # Price momentum
-    returns = prices_df["close"].pct_change()
+    if returns is None:
+        returns = prices_df["close"].pct_change()
     mom_1m = returns.rolling(21).sum()
     mom_3m = returns.rolling(63).sum()
     mom_6m = returns.rolling(126).sum()
@@ -254,8 +267,9 @@ def calculate_momentum_signals(prices_df):
     # Relative strength
     # (would compare to market/sector in real implementation)
 
-    # Calculate momentum score
-    momentum_score = (0.4 * mom_1m + 0.3 * mom_3m + 0.3 * mom_6m).iloc[-1]
+    # Calculate momentum score; only the latest value is used, so combine the
+    # scalar tails instead of building three full weighted Series first
+    momentum_score = 0.4 * mom_1m.iloc[-1] + 0.3 * mom_3m.iloc[-1] + 0.3 * mom_6m.iloc[-1]
 
     # Volume confirmation
     volume_confirmation = volume_momentum.iloc[-1] > 1.0
@@ -282,12 +296,13 @@ def calculate_momentum_signals(prices_df):
     }
 
 
-def calculate_volatility_signals(prices_df):
+def calculate_volatility_signals(prices_df, returns=None):
     """
     Volatility-based trading strategy
     """
     # Calculate various volatility metrics
-    returns = prices_df["close"].pct_change()
+    if returns is None:
+        returns = prices_df["close"].pct_change()
 
     # Historical volatility
     hist_vol = returns.rolling(21).std() * math.sqrt(252)
@@ -329,12 +344,13 @@ def calculate_volatility_signals(prices_df):
     }
 
 
-def calculate_stat_arb_signals(prices_df):
+def calculate_stat_arb_signals(prices_df, returns=None):
     """
     Statistical arbitrage signals based on price action analysis
     """
     # Calculate price distribution statistics
-    returns = prices_df["close"].pct_change()
+    if returns is None:
+        returns = prices_df["close"].pct_change()
 
     # Skewness and kurtosis
     skew = returns.rolling(63).skew()
@@ -517,9 +533,13 @@ def calculate_hurst_exponent(price_series: pd.Series, max_lag: int = 20) -> floa
     Returns:
         float: Hurst exponent
     """
+    # Work on the raw ndarray: plain slicing per lag, no pandas index
+    # alignment (which would line the two slices up by label and zero out
+    # every difference) and no per-lag Series construction
+    prices = np.asarray(price_series, dtype=np.float64)
     lags = range(2, max_lag)
     # Add small epsilon to avoid log(0)
-    tau = [max(1e-8, np.sqrt(np.std(np.subtract(price_series[lag:], price_series[:-lag])))) for lag in lags]
+    tau = [max(1e-8, np.sqrt(np.std(prices[lag:] - prices[:-lag]))) for lag in lags]
 
     # Return the Hurst exponent from linear fit
     try:
@@ -6,6 +6,7 @@ Implements four complementary valuation methodologies and aggregates them with
 configurable weights. 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from statistics import median
 import json
 from langchain_core.messages import HumanMessage
@@ -27,23 +28,15 @@ def valuation_analyst_agent(state: AgentState):
 
     valuation_analysis: dict[str, dict] = {}
 
-    for ticker in tickers:
-        progress.update_status("valuation_analyst_agent", ticker, "Fetching financial data")
-
-        # --- Historical financial metrics (pull 8 latest TTM snapshots for medians) ---
+    def fetch_ticker_data(ticker: str) -> tuple:
+        # Historical financial metrics (8 latest TTM snapshots for medians),
+        # fine-grained line items, and market cap for one ticker
         financial_metrics = get_financial_metrics(
             ticker=ticker,
             end_date=end_date,
             period="ttm",
             limit=8,
         )
-        if not financial_metrics:
-            progress.update_status("valuation_analyst_agent", ticker, "Failed: No financial metrics found")
-            continue
-        most_recent_metrics = financial_metrics[0]
-
-        # --- Fine‑grained line‑items (need two periods to calc WC change) ---
-        progress.update_status("valuation_analyst_agent", ticker, "Gathering line items")
         line_items = search_line_items(
             ticker=ticker,
             line_items=[
@@ -57,6 +50,24 @@ def valuation_analyst_agent(state: AgentState):
             period="ttm",
             limit=2,
         )
+        market_cap = get_market_cap(ticker, end_date)
+        return financial_metrics, line_items, market_cap
+
+    # The three fetches per ticker are independent network calls, so fan the
+    # tickers out over a thread pool instead of paying the latency serially.
+    progress.update_status("valuation_analyst_agent", None, "Fetching financial data")
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(tickers)))) as executor:
+        data_by_ticker = dict(zip(tickers, executor.map(fetch_ticker_data, tickers)))
+
+    for ticker in tickers:
+        progress.update_status("valuation_analyst_agent", ticker, "Calculating valuations")
+        financial_metrics, line_items, market_cap = data_by_ticker[ticker]
+
+        if not financial_metrics:
+            progress.update_status("valuation_analyst_agent", ticker, "Failed: No financial metrics found")
+            continue
+        most_recent_metrics = financial_metrics[0]
+
         if len(line_items) < 2:
             progress.update_status("valuation_analyst_agent", ticker, "Failed: Insufficient financial line items")
             continue
@@ -99,7 +110,6 @@ def valuation_analyst_agent(state: AgentState):
         # ------------------------------------------------------------------
         # Aggregate & signal
         # ------------------------------------------------------------------
-        market_cap = get_market_cap(ticker, end_date)
         if not market_cap:
             progress.update_status("valuation_analyst_agent", ticker, "Failed: Market cap unavailable")
             continue
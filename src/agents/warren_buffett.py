@@ -4,7 +4,7 @@ from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
-from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
+from src.tools.api import get_financial_metrics, get_financial_metrics_batch, get_market_cap, search_line_items
 from src.utils.llm import call_llm
 from src.utils.progress import progress
 
@@ -25,6 +25,10 @@ def warren_buffett_agent(state: AgentState):
     analysis_data = {}
     buffett_analysis = {}
 
+    # Warm the metrics cache for every ticker in one batch so uncached
+    # fetches overlap instead of running serially in the loop below.
+    get_financial_metrics_batch(tickers, end_date, period="ttm", limit=10)
+
     for ticker in tickers:
         progress.update_status("warren_buffett_agent", ticker, "Fetching financial metrics")
         # Fetch required data - request more periods for better trend analysis
@@ -1,10 +1,10 @@
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import questionary
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from colorama import Fore, Style, init
 import numpy as np
@@ -16,7 +16,6 @@ from src.main import run_hedge_fund
 from src.tools.api import (
     get_company_news,
     get_price_data,
-    get_prices,
     get_financial_metrics,
     get_insider_trades,
 )
@@ -26,6 +25,25 @@ from src.utils.ollama import ensure_ollama_and_model
 
 init(autoreset=True)
 
+# Annualization constants shared by the performance metrics below
+# (assumes 252 trading days/year); hoisted so the per-day metrics update
+# doesn't redo the division and sqrt on every call.
+DAILY_RISK_FREE_RATE = 0.0434 / 252
+ANNUALIZATION_FACTOR = np.sqrt(252)
+
+
+def calculate_max_drawdown(values: np.ndarray) -> tuple[float, int]:
+    """Compute the maximum drawdown of an equity curve in one fused pass.
+
+    Returns the most negative drawdown (as a fraction) and the index at
+    which it occurred. Uses numpy ufuncs (np.maximum.accumulate) directly
+    so no intermediate pandas Series are allocated.
+    """
+    rolling_max = np.maximum.accumulate(values)
+    drawdown = values / rolling_max - 1.0
+    trough = int(np.argmin(drawdown))
+    return float(drawdown[trough]), trough
+
 
 class Backtester:
     def __init__(
@@ -270,11 +288,15 @@ class Backtester:
         # Convert end_date string to datetime, fetch up to 1 year before
         end_date_dt = datetime.strptime(self.end_date, "%Y-%m-%d")
         start_date_dt = end_date_dt - relativedelta(years=1)
-        start_date_str = start_date_dt.strftime("%Y-%m-%d")
+        # Make sure the price history also covers the whole backtest window
+        # (plus the one-day lookback) for backtests longer than a year
+        backtest_start_dt = datetime.strptime(self.start_date, "%Y-%m-%d") - timedelta(days=30)
+        price_start_str = min(start_date_dt, backtest_start_dt).strftime("%Y-%m-%d")
 
-        for ticker in self.tickers:
-            # Fetch price data for the entire period, plus 1 year
-            get_prices(ticker, start_date_str, self.end_date)
+        def fetch_ticker_data(ticker: str) -> pd.DataFrame:
+            # Fetch price data for the entire period once and keep the frame;
+            # the daily loop slices it by label instead of refetching windows
+            price_df = get_price_data(ticker, price_start_str, self.end_date)
 
             # Fetch financial metrics
             get_financial_metrics(ticker, self.end_date, limit=10)
@@ -285,6 +307,19 @@ class Backtester:
             # Fetch company news
             get_company_news(ticker, self.end_date, start_date=self.start_date, limit=1000)
 
+            return price_df
+
+        # The four fetches per ticker are independent network calls, so fan the
+        # tickers out over a thread pool; the prefetch phase takes roughly one
+        # ticker's latency instead of the sum of all of them.
+        with ThreadPoolExecutor(max_workers=min(8, max(1, len(self.tickers)))) as executor:
+            self.price_dfs = dict(zip(self.tickers, executor.map(fetch_ticker_data, self.tickers)))
+
+        # One wide close-price frame (dates x tickers) so the daily loop can
+        # look up every ticker's price with a single label slice; dates a
+        # ticker didn't trade on show up as NaN in its column.
+        self.close_prices_df = pd.concat({ticker: df["close"] for ticker, df in self.price_dfs.items()}, axis=1)
+
         print("Data pre-fetch complete.")
 
     def run_backtest(self):
@@ -292,6 +327,11 @@ class Backtester:
         self.prefetch_data()
 
         dates = pd.date_range(self.start_date, self.end_date, freq="B")
+        # Format every date string for the run in three vectorized passes
+        # instead of three strftime calls per simulated day
+        date_strs = dates.strftime("%Y-%m-%d")
+        lookback_start_strs = (dates - timedelta(days=30)).strftime("%Y-%m-%d")
+        previous_date_strs = (dates - timedelta(days=1)).strftime("%Y-%m-%d")
         table_rows = []
         performance_metrics = {"sharpe_ratio": None, "sortino_ratio": None, "max_drawdown": None, "long_short_ratio": None, "gross_exposure": None, "net_exposure": None}
 
@@ -303,10 +343,10 @@ class Backtester:
         else:
             self.portfolio_values = []
 
-        for current_date in dates:
-            lookback_start = (current_date - timedelta(days=30)).strftime("%Y-%m-%d")
-            current_date_str = current_date.strftime("%Y-%m-%d")
-            previous_date_str = (current_date - timedelta(days=1)).strftime("%Y-%m-%d")
+        for i, current_date in enumerate(dates):
+            lookback_start = lookback_start_strs[i]
+            current_date_str = date_strs[i]
+            previous_date_str = previous_date_strs[i]
 
             # Skip if there's no prior day to look back (i.e., first date in the range)
             if lookback_start == current_date_str:
@@ -314,26 +354,22 @@ class Backtester:
 
             # Get current prices for all tickers
             try:
-                current_prices = {}
-                missing_data = False
-
-                for ticker in self.tickers:
-                    try:
-                        price_data = get_price_data(ticker, previous_date_str, current_date_str)
-                        if price_data.empty:
+                # One label slice of the wide frame covers every ticker; the
+                # sorted DatetimeIndex makes it a binary search. Forward-fill
+                # within the window so a ticker that traded on the previous
+                # day but not the current one keeps its last observed close,
+                # matching the old per-ticker window semantics.
+                window = self.close_prices_df.loc[previous_date_str:current_date_str]
+                last_closes = window.ffill().iloc[-1] if not window.empty else None
+                if last_closes is None or last_closes.isna().any():
+                    if last_closes is not None:
+                        for ticker in last_closes.index[last_closes.isna()]:
                             print(f"Warning: No price data for {ticker} on {current_date_str}")
-                            missing_data = True
-                            break
-                        current_prices[ticker] = price_data.iloc[-1]["close"]
-                    except Exception as e:
-                        print(f"Error fetching price for {ticker} between {previous_date_str} and {current_date_str}: {e}")
-                        missing_data = True
-                        break
-
-                if missing_data:
                     print(f"Skipping trading day {current_date_str} due to missing price data")
                     continue
 
+                current_prices = last_closes.to_dict()
+
             except Exception as e:
                 # If there's a general API error, log it and skip this day
                 print(f"Error fetching prices for {current_date_str}: {e}")
@@ -367,11 +403,18 @@ class Backtester:
             # 2) Now that trades have executed trades, recalculate the final
             #    portfolio value for this day.
             # ---------------------------------------------------------------
-            total_value = self.calculate_portfolio_value(current_prices)
-
-            # Also compute long/short exposures for final post‐trade state
-            long_exposure = sum(self.portfolio["positions"][t]["long"] * current_prices[t] for t in self.tickers)
-            short_exposure = sum(self.portfolio["positions"][t]["short"] * current_prices[t] for t in self.tickers)
+            # One pass over the positions yields both exposures, and the
+            # portfolio value follows arithmetically (cash + longs - shorts)
+            # instead of re-walking the positions dict two more times.
+            positions = self.portfolio["positions"]
+            long_exposure = 0.0
+            short_exposure = 0.0
+            for ticker in self.tickers:
+                position = positions[ticker]
+                price = current_prices[ticker]
+                long_exposure += position["long"] * price
+                short_exposure += position["short"] * price
+            total_value = self.portfolio["cash"] + long_exposure - short_exposure
 
             # Calculate gross and net exposures
             gross_exposure = long_exposure + short_exposure
@@ -386,16 +429,29 @@ class Backtester:
             # ---------------------------------------------------------------
             date_rows = []
 
+            # Pre-index signals by ticker so each ticker below is a single
+            # dict lookup instead of a scan over every agent's signal dict.
+            signals_by_ticker = {ticker: {} for ticker in self.tickers}
+            for agent_name, signals in analyst_signals.items():
+                for ticker, signal in signals.items():
+                    if ticker in signals_by_ticker:
+                        signals_by_ticker[ticker][agent_name] = signal
+
             # For each ticker, record signals/trades
             for ticker in self.tickers:
-                ticker_signals = {}
-                for agent_name, signals in analyst_signals.items():
-                    if ticker in signals:
-                        ticker_signals[agent_name] = signals[ticker]
-
-                bullish_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "bullish"])
-                bearish_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "bearish"])
-                neutral_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "neutral"])
+                ticker_signals = signals_by_ticker[ticker]
+
+                # Lowercase each signal once and tally all three classes in a
+                # single pass instead of three scans that re-lower every value
+                bullish_count = bearish_count = neutral_count = 0
+                for s in ticker_signals.values():
+                    signal_value = s.get("signal", "").lower()
+                    if signal_value == "bullish":
+                        bullish_count += 1
+                    elif signal_value == "bearish":
+                        bearish_count += 1
+                    elif signal_value == "neutral":
+                        neutral_count += 1
 
                 # Calculate net position value
                 pos = self.portfolio["positions"][ticker]
@@ -466,48 +522,45 @@ class Backtester:
 
     def _update_performance_metrics(self, performance_metrics):
         """Helper method to update performance metrics using daily returns."""
-        values_df = pd.DataFrame(self.portfolio_values).set_index("Date")
-        values_df["Daily Return"] = values_df["Portfolio Value"].pct_change()
-        clean_returns = values_df["Daily Return"].dropna()
+        # Work on flat ndarrays built straight from the running list instead of
+        # rebuilding a DataFrame (and its index) on every simulated day; daily
+        # returns fall out of one vectorized divide over the shifted values.
+        values = np.fromiter((entry["Portfolio Value"] for entry in self.portfolio_values), dtype=np.float64, count=len(self.portfolio_values))
+        clean_returns = values[1:] / values[:-1] - 1.0
 
         if len(clean_returns) < 2:
             return  # not enough data points
 
-        # Assumes 252 trading days/year
-        daily_risk_free_rate = 0.0434 / 252
-        excess_returns = clean_returns - daily_risk_free_rate
+        excess_returns = clean_returns - DAILY_RISK_FREE_RATE
         mean_excess_return = excess_returns.mean()
-        std_excess_return = excess_returns.std()
+        std_excess_return = excess_returns.std(ddof=1)
 
         # Sharpe ratio
         if std_excess_return > 1e-12:
-            performance_metrics["sharpe_ratio"] = np.sqrt(252) * (mean_excess_return / std_excess_return)
+            performance_metrics["sharpe_ratio"] = ANNUALIZATION_FACTOR * (mean_excess_return / std_excess_return)
         else:
             performance_metrics["sharpe_ratio"] = 0.0
 
-        # Sortino ratio
+        # Sortino ratio (sample std needs at least two downside observations)
         negative_returns = excess_returns[excess_returns < 0]
-        if len(negative_returns) > 0:
-            downside_std = negative_returns.std()
+        if negative_returns.size > 1:
+            downside_std = negative_returns.std(ddof=1)
             if downside_std > 1e-12:
-                performance_metrics["sortino_ratio"] = np.sqrt(252) * (mean_excess_return / downside_std)
+                performance_metrics["sortino_ratio"] = ANNUALIZATION_FACTOR * (mean_excess_return / downside_std)
             else:
                 performance_metrics["sortino_ratio"] = float("inf") if mean_excess_return > 0 else 0
         else:
             performance_metrics["sortino_ratio"] = float("inf") if mean_excess_return > 0 else 0
 
         # Maximum drawdown (ensure it's stored as a negative percentage)
-        rolling_max = values_df["Portfolio Value"].cummax()
-        drawdown = (values_df["Portfolio Value"] - rolling_max) / rolling_max
-
-        if len(drawdown) > 0:
-            min_drawdown = drawdown.min()
+        if len(values) > 0:
+            min_drawdown, trough = calculate_max_drawdown(values)
             # Store as a negative percentage
             performance_metrics["max_drawdown"] = min_drawdown * 100
 
             # Store the date of max drawdown for reference
             if min_drawdown < 0:
-                performance_metrics["max_drawdown_date"] = drawdown.idxmin().strftime("%Y-%m-%d")
+                performance_metrics["max_drawdown_date"] = self.portfolio_values[trough]["Date"].strftime("%Y-%m-%d")
             else:
                 performance_metrics["max_drawdown_date"] = None
         else:
@@ -520,7 +573,9 @@ class Backtester:
             print("No portfolio data found. Please run the backtest first.")
             return pd.DataFrame()
 
-        performance_df = pd.DataFrame(self.portfolio_values).set_index("Date")
+        # from_records is the fit-for-purpose constructor for a list of row
+        # dicts and takes the index directly, skipping the set_index copy.
+        performance_df = pd.DataFrame.from_records(self.portfolio_values, index="Date")
         if performance_df.empty:
             print("No valid performance data to analyze.")
             return performance_df
@@ -535,7 +590,11 @@ class Backtester:
         total_realized_gains = sum(self.portfolio["realized_gains"][ticker]["long"] + self.portfolio["realized_gains"][ticker]["short"] for ticker in self.tickers)
         print(f"Total Realized Gains/Losses: {Fore.GREEN if total_realized_gains >= 0 else Fore.RED}${total_realized_gains:,.2f}{Style.RESET_ALL}")
 
-        # Plot the portfolio value over time
+        # Plot the portfolio value over time. matplotlib is imported here
+        # rather than at module top so the backtest itself doesn't pay the
+        # heavy import and backend init unless a plot is actually drawn.
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(12, 6))
         plt.plot(performance_df.index, performance_df["Portfolio Value"], color="blue")
         plt.title("Portfolio Value Over Time")
@@ -546,13 +605,12 @@ class Backtester:
 
         # Compute daily returns
         performance_df["Daily Return"] = performance_df["Portfolio Value"].pct_change().fillna(0)
-        daily_rf = 0.0434 / 252  # daily risk-free rate
         mean_daily_return = performance_df["Daily Return"].mean()
         std_daily_return = performance_df["Daily Return"].std()
 
         # Annualized Sharpe Ratio
         if std_daily_return != 0:
-            annualized_sharpe = np.sqrt(252) * ((mean_daily_return - daily_rf) / std_daily_return)
+            annualized_sharpe = ANNUALIZATION_FACTOR * ((mean_daily_return - DAILY_RISK_FREE_RATE) / std_daily_return)
         else:
             annualized_sharpe = 0
         print(f"\nSharpe Ratio: {Fore.YELLOW}{annualized_sharpe:.2f}{Style.RESET_ALL}")
@@ -563,27 +621,30 @@ class Backtester:
 
         # If no value exists yet, calculate it
         if max_drawdown is None:
-            rolling_max = performance_df["Portfolio Value"].cummax()
-            drawdown = (performance_df["Portfolio Value"] - rolling_max) / rolling_max
-            max_drawdown = drawdown.min() * 100
-            max_drawdown_date = drawdown.idxmin().strftime("%Y-%m-%d") if pd.notnull(drawdown.idxmin()) else None
+            min_drawdown, trough = calculate_max_drawdown(performance_df["Portfolio Value"].to_numpy())
+            max_drawdown = min_drawdown * 100
+            max_drawdown_date = performance_df.index[trough].strftime("%Y-%m-%d") if pd.notnull(performance_df.index[trough]) else None
 
         if max_drawdown_date:
             print(f"Maximum Drawdown: {Fore.RED}{abs(max_drawdown):.2f}%{Style.RESET_ALL} (on {max_drawdown_date})")
         else:
             print(f"Maximum Drawdown: {Fore.RED}{abs(max_drawdown):.2f}%{Style.RESET_ALL}")
 
-        # Win Rate
-        winning_days = len(performance_df[performance_df["Daily Return"] > 0])
+        # Win Rate: build the daily-return array and win mask once, then reuse
+        # them for the win rate, win/loss averages, and streaks below instead
+        # of re-deriving a boolean Series (and frame subset) for each stat
+        daily_returns = performance_df["Daily Return"].to_numpy()
+        wins_mask = daily_returns > 0
+        winning_days = int(np.count_nonzero(wins_mask))
         total_days = max(len(performance_df) - 1, 1)
         win_rate = (winning_days / total_days) * 100
         print(f"Win Rate: {Fore.GREEN}{win_rate:.2f}%{Style.RESET_ALL}")
 
         # Average Win/Loss Ratio
-        positive_returns = performance_df[performance_df["Daily Return"] > 0]["Daily Return"]
-        negative_returns = performance_df[performance_df["Daily Return"] < 0]["Daily Return"]
-        avg_win = positive_returns.mean() if not positive_returns.empty else 0
-        avg_loss = abs(negative_returns.mean()) if not negative_returns.empty else 0
+        positive_returns = daily_returns[wins_mask]
+        negative_returns = daily_returns[daily_returns < 0]
+        avg_win = positive_returns.mean() if positive_returns.size else 0
+        avg_loss = abs(negative_returns.mean()) if negative_returns.size else 0
         if avg_loss != 0:
             win_loss_ratio = avg_win / avg_loss
         else:
@@ -591,7 +652,7 @@ class Backtester:
         print(f"Win/Loss Ratio: {Fore.GREEN}{win_loss_ratio:.2f}{Style.RESET_ALL}")
 
         # Maximum Consecutive Wins / Losses
-        returns_binary = (performance_df["Daily Return"] > 0).astype(int)
+        returns_binary = wins_mask.astype(int)
         if len(returns_binary) > 0:
             max_consecutive_wins = max((len(list(g)) for k, g in itertools.groupby(returns_binary) if k == 1), default=0)
             max_consecutive_losses = max((len(list(g)) for k, g in itertools.groupby(returns_binary) if k == 0), default=0)
@@ -1,12 +1,48 @@
+import threading
+
+
 class Cache:
     """In-memory cache for API responses."""
 
     def __init__(self):
-        self._prices_cache: dict[str, list[dict[str, any]]] = {}
-        self._financial_metrics_cache: dict[str, list[dict[str, any]]] = {}
-        self._line_items_cache: dict[str, list[dict[str, any]]] = {}
-        self._insider_trades_cache: dict[str, list[dict[str, any]]] = {}
-        self._company_news_cache: dict[str, list[dict[str, any]]] = {}
+        self._prices_cache: dict[tuple, list[dict[str, any]]] = {}
+        self._financial_metrics_cache: dict[tuple, list[dict[str, any]]] = {}
+        self._line_items_cache: dict[tuple, list[dict[str, any]]] = {}
+        self._insider_trades_cache: dict[tuple, list[dict[str, any]]] = {}
+        self._company_news_cache: dict[tuple, list[dict[str, any]]] = {}
+        self._caches = [self._prices_cache, self._financial_metrics_cache, self._line_items_cache, self._insider_trades_cache, self._company_news_cache]
+        # Ticker -> cache keys index (keys always lead with the ticker), so
+        # per-ticker invalidation touches only that ticker's entries instead
+        # of scanning every cached key.
+        self._ticker_keys: dict[str, set[tuple]] = {}
+        # The batch fetch helpers write from worker threads; set paths do a
+        # read-merge-write, so serialize them behind a lock. Reads stay
+        # lock-free since single dict lookups are atomic under the GIL.
+        self._lock = threading.Lock()
+        # Layers that memoize derived views of this cache (constructed model
+        # lists, DataFrames) register a callback here so per-ticker
+        # invalidation reaches them too.
+        self._invalidation_hooks: list = []
+
+    def _index_key(self, key: tuple):
+        """Record a cache key under its ticker for fast invalidation."""
+        self._ticker_keys.setdefault(key[0], set()).add(key)
+
+    def register_invalidation_hook(self, hook):
+        """Register a callable(ticker) run whenever a ticker is invalidated."""
+        self._invalidation_hooks.append(hook)
+
+    def clear_ticker_cache(self, ticker: str):
+        """Drop all cached entries for a ticker across every data type,
+        including derived memos registered via `register_invalidation_hook`."""
+        with self._lock:
+            for key in self._ticker_keys.pop(ticker, ()):
+                for cache in self._caches:
+                    cache.pop(key, None)
+        # Hooks run outside the lock: they guard their own structures and must
+        # not nest under ours.
+        for hook in self._invalidation_hooks:
+            hook(ticker)
 
     def _merge_data(self, existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
         """Merge existing and new data, avoiding duplicates based on a key field."""
@@ -21,45 +57,55 @@ class Cache:
         merged.extend([item for item in new_data if item[key_field] not in existing_keys])
         return merged
 
-    def get_prices(self, ticker: str) -> list[dict[str, any]] | None:
+    def get_prices(self, key: tuple) -> list[dict[str, any]] | None:
         """Get cached price data if available."""
-        return self._prices_cache.get(ticker)
+        return self._prices_cache.get(key)
 
-    def set_prices(self, ticker: str, data: list[dict[str, any]]):
+    def set_prices(self, key: tuple, data: list[dict[str, any]]):
         """Append new price data to cache."""
-        self._prices_cache[ticker] = self._merge_data(self._prices_cache.get(ticker), data, key_field="time")
+        with self._lock:
+            self._index_key(key)
+            self._prices_cache[key] = self._merge_data(self._prices_cache.get(key), data, key_field="time")
 
-    def get_financial_metrics(self, ticker: str) -> list[dict[str, any]]:
+    def get_financial_metrics(self, key: tuple) -> list[dict[str, any]]:
         """Get cached financial metrics if available."""
-        return self._financial_metrics_cache.get(ticker)
+        return self._financial_metrics_cache.get(key)
 
-    def set_financial_metrics(self, ticker: str, data: list[dict[str, any]]):
+    def set_financial_metrics(self, key: tuple, data: list[dict[str, any]]):
         """Append new financial metrics to cache."""
-        self._financial_metrics_cache[ticker] = self._merge_data(self._financial_metrics_cache.get(ticker), data, key_field="report_period")
+        with self._lock:
+            self._index_key(key)
+            self._financial_metrics_cache[key] = self._merge_data(self._financial_metrics_cache.get(key), data, key_field="report_period")
 
-    def get_line_items(self, ticker: str) -> list[dict[str, any]] | None:
+    def get_line_items(self, key: tuple) -> list[dict[str, any]] | None:
         """Get cached line items if available."""
-        return self._line_items_cache.get(ticker)
+        return self._line_items_cache.get(key)
 
-    def set_line_items(self, ticker: str, data: list[dict[str, any]]):
+    def set_line_items(self, key: tuple, data: list[dict[str, any]]):
         """Append new line items to cache."""
-        self._line_items_cache[ticker] = self._merge_data(self._line_items_cache.get(ticker), data, key_field="report_period")
+        with self._lock:
+            self._index_key(key)
+            self._line_items_cache[key] = self._merge_data(self._line_items_cache.get(key), data, key_field="report_period")
 
-    def get_insider_trades(self, ticker: str) -> list[dict[str, any]] | None:
+    def get_insider_trades(self, key: tuple) -> list[dict[str, any]] | None:
         """Get cached insider trades if available."""
-        return self._insider_trades_cache.get(ticker)
+        return self._insider_trades_cache.get(key)
 
-    def set_insider_trades(self, ticker: str, data: list[dict[str, any]]):
+    def set_insider_trades(self, key: tuple, data: list[dict[str, any]]):
         """Append new insider trades to cache."""
-        self._insider_trades_cache[ticker] = self._merge_data(self._insider_trades_cache.get(ticker), data, key_field="filing_date")  # Could also use transaction_date if preferred
+        with self._lock:
+            self._index_key(key)
+            self._insider_trades_cache[key] = self._merge_data(self._insider_trades_cache.get(key), data, key_field="filing_date")  # Could also use transaction_date if preferred
 
-    def get_company_news(self, ticker: str) -> list[dict[str, any]] | None:
+    def get_company_news(self, key: tuple) -> list[dict[str, any]] | None:
         """Get cached company news if available."""
-        return self._company_news_cache.get(ticker)
+        return self._company_news_cache.get(key)
 
-    def set_company_news(self, ticker: str, data: list[dict[str, any]]):
+    def set_company_news(self, key: tuple, data: list[dict[str, any]]):
         """Append new company news to cache."""
-        self._company_news_cache[ticker] = self._merge_data(self._company_news_cache.get(ticker), data, key_field="date")
+        with self._lock:
+            self._index_key(key)
+            self._company_news_cache[key] = self._merge_data(self._company_news_cache.get(key), data, key_field="date")
 
 
 # Global cache instance
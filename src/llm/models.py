@@ -7,6 +7,7 @@ from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
 from langchain_ollama import ChatOllama
 from enum import Enum
+from functools import lru_cache
 from pydantic import BaseModel
 from typing import Tuple, List
 from pathlib import Path
@@ -88,23 +89,54 @@ current_dir = Path(__file__).parent
 models_json_path = current_dir / "api_models.json"
 ollama_models_json_path = current_dir / "ollama_models.json"
 
-# Load available models from JSON
-AVAILABLE_MODELS = load_models_from_json(str(models_json_path))
 
-# Load Ollama models from JSON
-OLLAMA_MODELS = load_models_from_json(str(ollama_models_json_path))
+# The model lists are loaded lazily so that importing this module (e.g. just
+# for ModelProvider) doesn't pay the JSON parse and model construction cost.
+@lru_cache(maxsize=1)
+def _available_models() -> List[LLMModel]:
+    return load_models_from_json(str(models_json_path))
 
-# Create LLM_ORDER in the format expected by the UI
-LLM_ORDER = [model.to_choice_tuple() for model in AVAILABLE_MODELS]
 
-# Create Ollama LLM_ORDER separately
-OLLAMA_LLM_ORDER = [model.to_choice_tuple() for model in OLLAMA_MODELS]
+@lru_cache(maxsize=1)
+def _ollama_models() -> List[LLMModel]:
+    return load_models_from_json(str(ollama_models_json_path))
+
+
+@lru_cache(maxsize=1)
+def _model_index() -> dict[tuple[str, str], LLMModel]:
+    # Index models by (model_name, provider) once so lookups are a dict hit
+    # instead of rebuilding and scanning the combined model list on every call
+    index: dict[tuple[str, str], LLMModel] = {}
+    for model in _available_models() + _ollama_models():
+        index.setdefault((model.model_name, model.provider.value), model)
+    return index
+
+
+# Module-level names (AVAILABLE_MODELS, LLM_ORDER, ...) stay importable but
+# are materialized on first access instead of at import time (PEP 562).
+_LAZY_ATTRS = {
+    "AVAILABLE_MODELS": _available_models,
+    "OLLAMA_MODELS": _ollama_models,
+    "LLM_ORDER": lambda: [model.to_choice_tuple() for model in _available_models()],
+    "OLLAMA_LLM_ORDER": lambda: [model.to_choice_tuple() for model in _ollama_models()],
+}
+
+
+def __getattr__(name):
+    try:
+        factory = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Cache in module globals so later accesses skip __getattr__ entirely
+    value = globals()[name] = factory()
+    return value
 
 
 def get_model_info(model_name: str, model_provider: str) -> LLMModel | None:
     """Get model information by model_name"""
-    all_models = AVAILABLE_MODELS + OLLAMA_MODELS
-    return next((model for model in all_models if model.model_name == model_name and model.provider == model_provider), None)
+    # Accept both ModelProvider members and plain provider strings
+    provider = getattr(model_provider, "value", model_provider)
+    return _model_index().get((model_name, provider))
 
 
 def get_models_list():
@@ -115,7 +147,7 @@ def get_models_list():
             "model_name": model.model_name,
             "provider": model.provider.value
         }
-        for model in AVAILABLE_MODELS
+        for model in _available_models()
     ]
 
 
@@ -1,7 +1,12 @@
+import concurrent.futures
 import datetime
 import os
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
 import requests
+import threading
 import time
 
 from src.data.cache import get_cache
@@ -22,6 +27,24 @@ from src.data.models import (
 # Global cache instance
 _cache = get_cache()
 
+# Shared keep-alive session so TCP+TLS handshakes are amortized across all
+# API calls instead of paid per request
+_session = requests.Session()
+_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=50))
+
+# Single-flight bookkeeping: concurrent cold-cache fetches for the same key
+# wait on the first fetch instead of each hitting the API
+_inflight_lock = threading.Lock()
+_inflight: dict[tuple, threading.Event] = {}
+
+
+def _build_headers() -> dict:
+    """Build request headers, attaching the API key when one is configured."""
+    headers = {}
+    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
+        headers["X-API-KEY"] = api_key
+    return headers
+
 
 def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3) -> requests.Response:
     """
@@ -42,9 +65,9 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
     """
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         if method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=json_data)
+            response = _session.post(url, headers=headers, json=json_data)
         else:
-            response = requests.get(url, headers=headers)
+            response = _session.get(url, headers=headers)
         
         if response.status_code == 429 and attempt < max_retries:
             # Linear backoff: 60s, 90s, 120s, 150s...
@@ -60,32 +83,82 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
 def get_prices(ticker: str, start_date: str, end_date: str) -> list[Price]:
     """Fetch price data from cache or API."""
     # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date}_{end_date}"
+    cache_key = (ticker, start_date, end_date)
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_prices(cache_key):
-        return [Price(**price) for price in cached_data]
+        # Rebuild without re-validating; the cache only ever holds our own model dumps
+        return [Price.model_construct(**price) for price in cached_data]
 
-    # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    # Single-flight: if another thread is already fetching this key, wait for
+    # it to finish and reread the cache instead of duplicating the request
+    while True:
+        with _inflight_lock:
+            event = _inflight.get(cache_key)
+            if event is None:
+                event = _inflight[cache_key] = threading.Event()
+                break
+        event.wait()
+        if cached_data := _cache.get_prices(cache_key):
+            return [Price.model_construct(**price) for price in cached_data]
+        # The in-flight fetch came back empty or failed; become the fetcher
+
+    try:
+        # If not in cache, fetch from API
+        headers = _build_headers()
+
+        url = f"https://api.financialdatasets.ai/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
+        response = _make_api_request(url, headers)
+        if response.status_code != 200:
+            raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
 
-    url = f"https://api.financialdatasets.ai/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
-    response = _make_api_request(url, headers)
-    if response.status_code != 200:
-        raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
+        # Parse response with Pydantic model
+        price_response = PriceResponse(**response.json())
+        prices = price_response.prices
 
-    # Parse response with Pydantic model
-    price_response = PriceResponse(**response.json())
-    prices = price_response.prices
+        if not prices:
+            return []
 
-    if not prices:
-        return []
+        # Cache the results using the comprehensive cache key
+        _cache.set_prices(cache_key, [p.model_dump() for p in prices])
+        return prices
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_key, None)
+        event.set()
 
-    # Cache the results using the comprehensive cache key
-    _cache.set_prices(cache_key, [p.model_dump() for p in prices])
-    return prices
+
+def get_prices_batch(tickers: list[str], start_date: str, end_date: str) -> dict[str, list[Price]]:
+    """Fetch price data for multiple tickers, dispatching uncached fetches concurrently.
+
+    The prices endpoint is per-ticker, so cache misses are fanned out over a
+    thread pool instead of fetched serially. Results are cached per ticker with
+    the same key shape as `get_prices`, so the two stay interchangeable.
+    """
+    if not tickers:
+        return {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(tickers))) as executor:
+        future_to_ticker = {executor.submit(get_prices, ticker=ticker, start_date=start_date, end_date=end_date): ticker for ticker in tickers}
+        return {future_to_ticker[future]: future.result() for future in concurrent.futures.as_completed(future_to_ticker)}
+
+
+# Nearly every analyst agent asks for the same metrics window per ticker, so
+# memoize the constructed model lists: a repeat call returns the same models
+# instead of rebuilding ~60-field objects from the cached dicts. Callers treat
+# the models as read-only; the list itself is copied per call. The lock keeps
+# the get/move_to_end/popitem sequences atomic, since the batch helpers call
+# in from worker threads.
+_FINANCIAL_METRICS_MEMO_MAXSIZE = 256
+_financial_metrics_memo: OrderedDict[tuple, list[FinancialMetrics]] = OrderedDict()
+_financial_metrics_memo_lock = threading.Lock()
+
+
+def _memoize_financial_metrics(cache_key: tuple, models: list[FinancialMetrics]):
+    with _financial_metrics_memo_lock:
+        _financial_metrics_memo[cache_key] = models
+        if len(_financial_metrics_memo) > _FINANCIAL_METRICS_MEMO_MAXSIZE:
+            _financial_metrics_memo.popitem(last=False)
 
 
 def get_financial_metrics(
@@ -96,16 +169,22 @@ def get_financial_metrics(
 ) -> list[FinancialMetrics]:
     """Fetch financial metrics from cache or API."""
     # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{period}_{end_date}_{limit}"
-    
+    cache_key = (ticker, period, end_date, limit)
+
+    # Already-constructed models from an earlier call with the same key
+    with _financial_metrics_memo_lock:
+        if (models := _financial_metrics_memo.get(cache_key)) is not None:
+            _financial_metrics_memo.move_to_end(cache_key)
+            return list(models)
+
     # Check cache first - simple exact match
     if cached_data := _cache.get_financial_metrics(cache_key):
-        return [FinancialMetrics(**metric) for metric in cached_data]
+        models = [FinancialMetrics.model_construct(**metric) for metric in cached_data]
+        _memoize_financial_metrics(cache_key, models)
+        return list(models)
 
     # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    headers = _build_headers()
 
     url = f"https://api.financialdatasets.ai/financial-metrics/?ticker={ticker}&report_period_lte={end_date}&limit={limit}&period={period}"
     response = _make_api_request(url, headers)
@@ -121,7 +200,28 @@ def get_financial_metrics(
 
     # Cache the results as dicts using the comprehensive cache key
     _cache.set_financial_metrics(cache_key, [m.model_dump() for m in financial_metrics])
-    return financial_metrics
+    _memoize_financial_metrics(cache_key, financial_metrics)
+    return list(financial_metrics)
+
+
+def get_financial_metrics_batch(
+    tickers: list[str],
+    end_date: str,
+    period: str = "ttm",
+    limit: int = 10,
+) -> dict[str, list[FinancialMetrics]]:
+    """Fetch financial metrics for multiple tickers, dispatching uncached fetches concurrently.
+
+    Mirrors `get_prices_batch`: cache misses are fanned out over a thread pool
+    and results are cached per ticker with the same key shape as
+    `get_financial_metrics`.
+    """
+    if not tickers:
+        return {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+        future_to_ticker = {executor.submit(get_financial_metrics, ticker=ticker, end_date=end_date, period=period, limit=limit): ticker for ticker in tickers}
+        return {future_to_ticker[future]: future.result() for future in concurrent.futures.as_completed(future_to_ticker)}
 
 
 def search_line_items(
@@ -131,11 +231,16 @@ def search_line_items(
     period: str = "ttm",
     limit: int = 10,
 ) -> list[LineItem]:
-    """Fetch line items from API."""
-    # If not in cache or insufficient data, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    """Fetch line items from cache or API."""
+    # Create a cache key that includes all parameters to ensure exact matches
+    cache_key = (ticker, tuple(sorted(line_items)), end_date, period, limit)
+
+    # Check cache first - simple exact match
+    if cached_data := _cache.get_line_items(cache_key):
+        return [LineItem.model_construct(**item) for item in cached_data]
+
+    # If not in cache, fetch from API
+    headers = _build_headers()
 
     url = "https://api.financialdatasets.ai/financials/search/line-items"
 
@@ -155,8 +260,10 @@ def search_line_items(
     if not search_results:
         return []
 
-    # Cache the results
-    return search_results[:limit]
+    # Cache the results using the comprehensive cache key
+    search_results = search_results[:limit]
+    _cache.set_line_items(cache_key, [item.model_dump() for item in search_results])
+    return search_results
 
 
 def get_insider_trades(
@@ -167,16 +274,14 @@ def get_insider_trades(
 ) -> list[InsiderTrade]:
     """Fetch insider trades from cache or API."""
     # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
+    cache_key = (ticker, start_date, end_date, limit)
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_insider_trades(cache_key):
-        return [InsiderTrade(**trade) for trade in cached_data]
+        return [InsiderTrade.model_construct(**trade) for trade in cached_data]
 
     # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    headers = _build_headers()
 
     all_trades = []
     current_end_date = end_date
@@ -219,6 +324,21 @@ def get_insider_trades(
     return all_trades
 
 
+def get_insider_trades_batch(
+    tickers: list[str],
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+) -> dict[str, list[InsiderTrade]]:
+    """Fetch insider trades for multiple tickers, dispatching uncached fetches concurrently."""
+    if not tickers:
+        return {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+        future_to_ticker = {executor.submit(get_insider_trades, ticker=ticker, end_date=end_date, start_date=start_date, limit=limit): ticker for ticker in tickers}
+        return {future_to_ticker[future]: future.result() for future in concurrent.futures.as_completed(future_to_ticker)}
+
+
 def get_company_news(
     ticker: str,
     end_date: str,
@@ -227,16 +347,14 @@ def get_company_news(
 ) -> list[CompanyNews]:
     """Fetch company news from cache or API."""
     # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
+    cache_key = (ticker, start_date, end_date, limit)
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_company_news(cache_key):
-        return [CompanyNews(**news) for news in cached_data]
+        return [CompanyNews.model_construct(**news) for news in cached_data]
 
     # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    headers = _build_headers()
 
     all_news = []
     current_end_date = end_date
@@ -279,17 +397,53 @@ def get_company_news(
     return all_news
 
 
+def get_company_news_batch(
+    tickers: list[str],
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+) -> dict[str, list[CompanyNews]]:
+    """Fetch company news for multiple tickers, dispatching uncached fetches concurrently."""
+    if not tickers:
+        return {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+        future_to_ticker = {executor.submit(get_company_news, ticker=ticker, end_date=end_date, start_date=start_date, limit=limit): ticker for ticker in tickers}
+        return {future_to_ticker[future]: future.result() for future in concurrent.futures.as_completed(future_to_ticker)}
+
+
+# Same-day market caps move intraday, so they get a short TTL instead of the
+# indefinite caching used for historical data: ticker -> (fetched_at, value)
+_MARKET_CAP_TTL_SECONDS = 900
+_market_cap_cache: dict[str, tuple[float, float | None]] = {}
+
+# Today's date formats identically within a second, so memoize the string
+# instead of paying a clock read + strftime on every market-cap lookup.
+_today_memo: tuple[float, str] = (float("-inf"), "")
+
+
+def _today() -> str:
+    """Return today's date as YYYY-MM-DD, refreshed at most once per second."""
+    global _today_memo
+    now = time.monotonic()
+    if now - _today_memo[0] >= 1.0:
+        _today_memo = (now, datetime.datetime.now().strftime("%Y-%m-%d"))
+    return _today_memo[1]
+
+
 def get_market_cap(
     ticker: str,
     end_date: str,
 ) -> float | None:
     """Fetch market cap from the API."""
     # Check if end_date is today
-    if end_date == datetime.datetime.now().strftime("%Y-%m-%d"):
+    if end_date == _today():
+        # Serve a recent same-day value from the TTL cache when possible
+        if (entry := _market_cap_cache.get(ticker)) and time.monotonic() - entry[0] < _MARKET_CAP_TTL_SECONDS:
+            return entry[1]
+
         # Get the market cap from company facts API
-        headers = {}
-        if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-            headers["X-API-KEY"] = api_key
+        headers = _build_headers()
 
         url = f"https://api.financialdatasets.ai/company/facts/?ticker={ticker}"
         response = _make_api_request(url, headers)
@@ -299,7 +453,9 @@ def get_market_cap(
 
         data = response.json()
         response_model = CompanyFactsResponse(**data)
-        return response_model.company_facts.market_cap
+        market_cap = response_model.company_facts.market_cap
+        _market_cap_cache[ticker] = (time.monotonic(), market_cap)
+        return market_cap
 
     financial_metrics = get_financial_metrics(ticker, end_date)
     if not financial_metrics:
@@ -315,17 +471,74 @@ def get_market_cap(
 
 def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
-    df = pd.DataFrame([p.model_dump() for p in prices])
-    df["Date"] = pd.to_datetime(df["time"])
-    df.set_index("Date", inplace=True)
-    numeric_cols = ["open", "close", "high", "low", "volume"]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df.sort_index(inplace=True)
+    # Build the frame from typed numpy arrays instead of per-row dicts; with
+    # the dtype named up front, pandas adopts each array as-is and skips its
+    # per-column inference pass entirely.
+    n = len(prices)
+    times = [p.time for p in prices]
+    df = pd.DataFrame(
+        {
+            "open": np.fromiter((p.open for p in prices), dtype=np.float64, count=n),
+            "close": np.fromiter((p.close for p in prices), dtype=np.float64, count=n),
+            "high": np.fromiter((p.high for p in prices), dtype=np.float64, count=n),
+            "low": np.fromiter((p.low for p in prices), dtype=np.float64, count=n),
+            "volume": np.fromiter((p.volume for p in prices), dtype=np.int64, count=n),
+            "time": times,
+        },
+        # The API always returns ISO-8601 timestamps, so name the format
+        # explicitly and skip pandas' per-element format inference.
+        index=pd.DatetimeIndex(pd.to_datetime(times, format="ISO8601"), name="Date"),
+    )
+    # The API returns bars oldest-first, so the sort is usually a no-op;
+    # the monotonic check is O(n) versus an unconditional O(n log n) sort
+    # plus a full-frame shuffle.
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
     return df
 
 
+# Memoized DataFrame conversions, keyed like the price cache. The cache keeps
+# price data in row-oriented dicts; converting to columnar form is the
+# expensive step, so reuse it across callers instead of redoing it per call.
+# LRU-bounded so a long backtest over many (ticker, window) pairs can't hold
+# an unbounded number of frames alive. Locked because the backtester's
+# prefetch pool calls in from worker threads.
+_PRICE_DF_CACHE_MAXSIZE = 256
+_price_df_cache: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+_price_df_cache_lock = threading.Lock()
+
+
 # Update the get_price_data function to use the new functions
 def get_price_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
-    prices = get_prices(ticker, start_date, end_date)
-    return prices_to_df(prices)
+    key = (ticker, start_date, end_date)
+    with _price_df_cache_lock:
+        df = _price_df_cache.get(key)
+        if df is not None:
+            _price_df_cache.move_to_end(key)
+    if df is None:
+        prices = get_prices(ticker, start_date, end_date)
+        df = prices_to_df(prices)
+        with _price_df_cache_lock:
+            _price_df_cache[key] = df
+            if len(_price_df_cache) > _PRICE_DF_CACHE_MAXSIZE:
+                _price_df_cache.popitem(last=False)
+    # Return a copy so callers that add columns don't alias the cached frame
+    return df.copy()
+
+
+def _evict_ticker_memos(ticker: str):
+    """Drop this module's derived memos for a ticker.
+
+    Registered with the shared cache so `clear_ticker_cache` invalidation
+    reaches the memoized model lists and DataFrames layered on top of it.
+    """
+    with _financial_metrics_memo_lock:
+        for key in [k for k in _financial_metrics_memo if k[0] == ticker]:
+            del _financial_metrics_memo[key]
+    with _price_df_cache_lock:
+        for key in [k for k in _price_df_cache if k[0] == ticker]:
+            del _price_df_cache[key]
+    _market_cap_cache.pop(ticker, None)
+
+
+_cache.register_invalidation_hook(_evict_ticker_memos)
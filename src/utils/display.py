@@ -4,14 +4,37 @@ from .analysts import ANALYST_ORDER
 import os
 import json
 
+# Color lookup tables are invariant, so build them once at import time
+# instead of reconstructing a dict per signal/row formatted.
+SIGNAL_COLORS = {
+    "BULLISH": Fore.GREEN,
+    "BEARISH": Fore.RED,
+    "NEUTRAL": Fore.YELLOW,
+}
+
+ACTION_COLORS = {
+    "BUY": Fore.GREEN,
+    "SELL": Fore.RED,
+    "HOLD": Fore.YELLOW,
+    "COVER": Fore.GREEN,
+    "SHORT": Fore.RED,
+}
+
+BACKTEST_ACTION_COLORS = {
+    "BUY": Fore.GREEN,
+    "COVER": Fore.GREEN,
+    "SELL": Fore.RED,
+    "SHORT": Fore.RED,
+    "HOLD": Fore.WHITE,
+}
+
+ANALYST_DISPLAY_ORDER = {display: idx for idx, (display, _) in enumerate(ANALYST_ORDER)}
+ANALYST_DISPLAY_ORDER["Risk Management"] = len(ANALYST_ORDER)  # Add Risk Management at the end
+
 
 def sort_agent_signals(signals):
     """Sort agent signals in a consistent order."""
-    # Create order mapping from ANALYST_ORDER
-    analyst_order = {display: idx for idx, (display, _) in enumerate(ANALYST_ORDER)}
-    analyst_order["Risk Management"] = len(ANALYST_ORDER)  # Add Risk Management at the end
-
-    return sorted(signals, key=lambda x: analyst_order.get(x[0], 999))
+    return sorted(signals, key=lambda x: ANALYST_DISPLAY_ORDER.get(x[0], 999))
 
 
 def print_trading_output(result: dict) -> None:
@@ -46,11 +69,7 @@ def print_trading_output(result: dict) -> None:
             signal_type = signal.get("signal", "").upper()
             confidence = signal.get("confidence", 0)
 
-            signal_color = {
-                "BULLISH": Fore.GREEN,
-                "BEARISH": Fore.RED,
-                "NEUTRAL": Fore.YELLOW,
-            }.get(signal_type, Fore.WHITE)
+            signal_color = SIGNAL_COLORS.get(signal_type, Fore.WHITE)
             
             # Get reasoning if available
             reasoning_str = ""
@@ -110,13 +129,7 @@ def print_trading_output(result: dict) -> None:
 
         # Print Trading Decision Table
         action = decision.get("action", "").upper()
-        action_color = {
-            "BUY": Fore.GREEN,
-            "SELL": Fore.RED,
-            "HOLD": Fore.YELLOW,
-            "COVER": Fore.GREEN,
-            "SHORT": Fore.RED,
-        }.get(action, Fore.WHITE)
+        action_color = ACTION_COLORS.get(action, Fore.WHITE)
 
         # Get reasoning and format it
         reasoning = decision.get("reasoning", "")
@@ -164,13 +177,7 @@ def print_trading_output(result: dict) -> None:
             
     for ticker, decision in decisions.items():
         action = decision.get("action", "").upper()
-        action_color = {
-            "BUY": Fore.GREEN,
-            "SELL": Fore.RED,
-            "HOLD": Fore.YELLOW,
-            "COVER": Fore.GREEN,
-            "SHORT": Fore.RED,
-        }.get(action, Fore.WHITE)
+        action_color = ACTION_COLORS.get(action, Fore.WHITE)
         portfolio_data.append(
             [
                 f"{Fore.CYAN}{ticker}{Style.RESET_ALL}",
@@ -326,13 +333,7 @@ def format_backtest_row(
 ) -> list[any]:
     """Format a row for the backtest results table"""
     # Color the action
-    action_color = {
-        "BUY": Fore.GREEN,
-        "COVER": Fore.GREEN,
-        "SELL": Fore.RED,
-        "SHORT": Fore.RED,
-        "HOLD": Fore.WHITE,
-    }.get(action.upper(), Fore.WHITE)
+    action_color = BACKTEST_ACTION_COLORS.get(action.upper(), Fore.WHITE)
 
     if is_summary:
         return_color = Fore.GREEN if return_pct >= 0 else Fore.RED
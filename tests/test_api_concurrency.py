@@ -0,0 +1,235 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.tools import api
+from src.tools.api import (
+    get_financial_metrics_batch,
+    get_prices,
+    get_prices_batch,
+)
+
+
+def _price_payload(ticker: str) -> dict:
+    """Build a one-row prices API response body for a ticker."""
+    return {
+        "ticker": ticker,
+        "prices": [
+            {
+                "time": "2024-01-01T00:00:00Z",
+                "open": 100.0,
+                "close": 101.0,
+                "high": 102.0,
+                "low": 99.0,
+                "volume": 1000,
+            }
+        ],
+    }
+
+
+def _ok_response(ticker: str) -> Mock:
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = _price_payload(ticker)
+    return response
+
+
+@pytest.fixture
+def clean_ticker():
+    """Yield a ticker symbol and drop all its cached state afterwards."""
+    ticker = "CCTEST"
+    api._cache.clear_ticker_cache(ticker)
+    yield ticker
+    api._cache.clear_ticker_cache(ticker)
+
+
+class TestSingleFlight:
+    """Test suite for the single-flight coordination in get_prices."""
+
+    @patch('src.tools.api._make_api_request')
+    def test_concurrent_cold_calls_fetch_once(self, mock_request, clean_ticker):
+        """N concurrent calls for one cold key produce exactly one API request."""
+        def slow_fetch(url, headers):
+            # Hold the fetch open long enough for the other threads to pile
+            # up behind the in-flight event
+            time.sleep(0.05)
+            return _ok_response(clean_ticker)
+
+        mock_request.side_effect = slow_fetch
+
+        with patch.dict(os.environ, {"FINANCIAL_DATASETS_API_KEY": "test-key"}):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [
+                    executor.submit(get_prices, clean_ticker, "2024-01-01", "2024-01-02")
+                    for _ in range(8)
+                ]
+                results = [future.result(timeout=10) for future in futures]
+
+        # One fetch served every caller, and everyone saw the same data
+        assert mock_request.call_count == 1
+        for result in results:
+            assert len(result) == 1
+            assert result[0].close == 101.0
+
+    @patch('src.tools.api._make_api_request')
+    def test_waiter_reads_cache_after_fetch_completes(self, mock_request, clean_ticker):
+        """A waiter blocked on the in-flight event returns the cached result without calling the API."""
+        cache_key = (clean_ticker, "2024-01-01", "2024-01-02")
+        event = threading.Event()
+        with api._inflight_lock:
+            api._inflight[cache_key] = event
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            waiter = executor.submit(get_prices, clean_ticker, "2024-01-01", "2024-01-02")
+
+            # Simulate the fetcher finishing: populate the cache, then release
+            time.sleep(0.05)
+            assert not waiter.done()
+            api._cache.set_prices(cache_key, _price_payload(clean_ticker)["prices"])
+            with api._inflight_lock:
+                api._inflight.pop(cache_key, None)
+            event.set()
+
+            result = waiter.result(timeout=10)
+
+        assert len(result) == 1
+        assert result[0].close == 101.0
+        mock_request.assert_not_called()
+
+    @patch('src.tools.api._make_api_request')
+    def test_fetcher_error_releases_waiters(self, mock_request, clean_ticker):
+        """A failed fetch wakes waiters instead of deadlocking them; one retries and succeeds."""
+        error_response = Mock()
+        error_response.status_code = 500
+        error_response.text = "Internal Server Error"
+
+        call_count_lock = threading.Lock()
+        call_count = 0
+
+        def fetch(url, headers):
+            nonlocal call_count
+            with call_count_lock:
+                call_count += 1
+                first_call = call_count == 1
+            if first_call:
+                # Keep the failing fetch open so the second caller is waiting
+                # on the event when it errors out
+                time.sleep(0.05)
+                return error_response
+            return _ok_response(clean_ticker)
+
+        mock_request.side_effect = fetch
+
+        with patch.dict(os.environ, {"FINANCIAL_DATASETS_API_KEY": "test-key"}):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(get_prices, clean_ticker, "2024-01-01", "2024-01-02")
+                    for _ in range(2)
+                ]
+                outcomes = []
+                for future in futures:
+                    try:
+                        outcomes.append(future.result(timeout=10))
+                    except Exception as exc:
+                        outcomes.append(exc)
+
+        # The first fetcher surfaced the error; the waiter became the fetcher
+        # and got data instead of hanging
+        errors = [o for o in outcomes if isinstance(o, Exception)]
+        successes = [o for o in outcomes if not isinstance(o, Exception)]
+        assert len(errors) == 1
+        assert "500" in str(errors[0])
+        assert len(successes) == 1
+        assert successes[0][0].close == 101.0
+        assert mock_request.call_count == 2
+
+
+class TestBatchHelpers:
+    """Test suite for the multi-ticker batch fetch helpers."""
+
+    @patch('src.tools.api.get_prices')
+    def test_get_prices_batch_maps_results_to_tickers(self, mock_get_prices):
+        """Each ticker maps to its own result despite completion-order collection."""
+        mock_get_prices.side_effect = lambda ticker, start_date, end_date: [f"{ticker}-prices"]
+
+        tickers = ["AAPL", "MSFT", "NVDA"]
+        result = get_prices_batch(tickers, "2024-01-01", "2024-01-02")
+
+        assert result == {ticker: [f"{ticker}-prices"] for ticker in tickers}
+        assert mock_get_prices.call_count == 3
+
+    @patch('src.tools.api.get_financial_metrics')
+    def test_get_financial_metrics_batch_maps_results_to_tickers(self, mock_get_metrics):
+        """Each ticker maps to its own metrics list."""
+        mock_get_metrics.side_effect = lambda ticker, end_date, period, limit: [f"{ticker}-metrics"]
+
+        tickers = ["AAPL", "MSFT", "NVDA"]
+        result = get_financial_metrics_batch(tickers, "2024-01-01", period="ttm", limit=5)
+
+        assert result == {ticker: [f"{ticker}-metrics"] for ticker in tickers}
+        assert mock_get_metrics.call_count == 3
+
+    def test_empty_ticker_list_returns_empty_map(self):
+        """Batch helpers are a no-op for an empty ticker list."""
+        assert get_prices_batch([], "2024-01-01", "2024-01-02") == {}
+        assert get_financial_metrics_batch([], "2024-01-01") == {}
+
+
+class TestClearTickerCache:
+    """Test suite for per-ticker invalidation across the cache and api memos."""
+
+    def test_clears_cache_and_derived_memos(self, clean_ticker):
+        """Invalidation drops the raw cache entries and the derived memos, leaving other tickers alone."""
+        import pandas as pd
+
+        other = "CCOTHER"
+        api._cache.clear_ticker_cache(other)
+        try:
+            for ticker in (clean_ticker, other):
+                prices_key = (ticker, "2024-01-01", "2024-01-02")
+                metrics_key = (ticker, "ttm", "2024-01-02", 10)
+                api._cache.set_prices(prices_key, _price_payload(ticker)["prices"])
+                with api._price_df_cache_lock:
+                    api._price_df_cache[prices_key] = pd.DataFrame({"close": [101.0]})
+                with api._financial_metrics_memo_lock:
+                    api._financial_metrics_memo[metrics_key] = []
+                api._market_cap_cache[ticker] = (time.monotonic(), 1e12)
+
+            api._cache.clear_ticker_cache(clean_ticker)
+
+            # The cleared ticker is gone from every layer
+            assert api._cache.get_prices((clean_ticker, "2024-01-01", "2024-01-02")) is None
+            assert all(key[0] != clean_ticker for key in api._price_df_cache)
+            assert all(key[0] != clean_ticker for key in api._financial_metrics_memo)
+            assert clean_ticker not in api._market_cap_cache
+
+            # The other ticker's entries survive
+            assert api._cache.get_prices((other, "2024-01-01", "2024-01-02")) is not None
+            assert any(key[0] == other for key in api._price_df_cache)
+            assert any(key[0] == other for key in api._financial_metrics_memo)
+            assert other in api._market_cap_cache
+        finally:
+            api._cache.clear_ticker_cache(other)
+
+    @patch('src.tools.api._make_api_request')
+    def test_cleared_ticker_refetches(self, mock_request, clean_ticker):
+        """After invalidation, get_prices goes back to the API instead of serving stale data."""
+        mock_request.return_value = _ok_response(clean_ticker)
+
+        with patch.dict(os.environ, {"FINANCIAL_DATASETS_API_KEY": "test-key"}):
+            get_prices(clean_ticker, "2024-01-01", "2024-01-02")
+            get_prices(clean_ticker, "2024-01-01", "2024-01-02")
+            assert mock_request.call_count == 1  # second call served from cache
+
+            api._cache.clear_ticker_cache(clean_ticker)
+            get_prices(clean_ticker, "2024-01-01", "2024-01-02")
+
+        assert mock_request.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])